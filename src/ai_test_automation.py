@@ -9,23 +9,445 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import json
+import statistics
+import threading
 import time
 
+from data_generator import AIDataGenerator
+
+# Installed before navigation (Page.addScriptToEvaluateOnNewDocument) so that
+# fetch/XHR requests an SPA starts during load are counted. Tracks in-flight
+# requests, resource completions and DOM mutations on window.__aiReadiness.
+PAGE_READINESS_INSTRUMENTATION_SCRIPT = """
+(function () {
+    if (window.__aiReadiness) {
+        return;
+    }
+    var state = window.__aiReadiness = {inflight: 0, lastNetwork: Date.now(), lastMutation: Date.now()};
+    var markNetwork = function () { state.lastNetwork = Date.now(); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.inflight++;
+            markNetwork();
+            return originalFetch.apply(this, arguments).finally(function () {
+                state.inflight--;
+                markNetwork();
+            });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var settled = false;
+        var settle = function () {
+            if (!settled) {
+                settled = true;
+                state.inflight--;
+                markNetwork();
+            }
+        };
+        state.inflight++;
+        markNetwork();
+        this.addEventListener('loadend', settle);
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            // send() threw synchronously (e.g. InvalidStateError), so loadend will never fire
+            settle();
+            throw e;
+        }
+    };
+    if (window.PerformanceObserver) {
+        try {
+            new PerformanceObserver(markNetwork).observe({type: 'resource', buffered: true});
+        } catch (e) {}
+    }
+    new MutationObserver(function () { state.lastMutation = Date.now(); }).observe(
+        document, {childList: true, subtree: true, attributes: __WATCH_ATTRIBUTES__, characterData: __WATCH_ATTRIBUTES__}
+    );
+})();
+"""
+
+# The Resource Timing buffer holds only 250 entries by default; heavy pages
+# would silently lose the rest, so enlarge it and keep growing it when full.
+RESOURCE_TIMING_BUFFER_SCRIPT = """
+(function () {
+    if (!window.performance || !performance.setResourceTimingBufferSize) {
+        return;
+    }
+    var size = __BUFFER_SIZE__;
+    performance.setResourceTimingBufferSize(size);
+    performance.addEventListener('resourcetimingbufferfull', function () {
+        size *= 2;
+        performance.setResourceTimingBufferSize(size);
+    });
+})();
+"""
+
+RESOURCE_TIMING_BUFFER_SIZE = 5000
+
+# Resolves once the instrumented page has been network-idle and DOM-quiet for
+# the configured windows; resolves null if the instrumentation is missing.
+PAGE_QUIET_WAIT_SCRIPT = """
+var quietWindow = arguments[0];
+var networkIdleWindow = arguments[1];
+var done = arguments[arguments.length - 1];
+var state = window.__aiReadiness;
+if (!state) {
+    done(null);
+    return;
+}
+var check = function () {
+    var now = Date.now();
+    if (document.readyState === 'complete' && state.inflight <= 0 &&
+            now - state.lastNetwork >= networkIdleWindow &&
+            now - state.lastMutation >= quietWindow) {
+        done(true);
+    } else {
+        setTimeout(check, 50);
+    }
+};
+check();
+"""
+
+
+def readiness_instrumentation_script(watch_attributes=False):
+    """Build the readiness instrumentation, optionally treating attribute/text changes as DOM activity"""
+    return PAGE_READINESS_INSTRUMENTATION_SCRIPT.replace(
+        '__WATCH_ATTRIBUTES__', 'true' if watch_attributes else 'false'
+    )
+
+
+PERFORMANCE_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource').map(function (r) {
+    return {
+        name: r.name,
+        initiatorType: r.initiatorType,
+        startTime: r.startTime,
+        duration: r.duration,
+        transferSize: r.transferSize || 0,
+        encodedBodySize: r.encodedBodySize || 0
+    };
+});
+return {navigation: nav ? nav.toJSON() : null, resources: resources};
+"""
+
+
+def summarize_performance_timing(raw_timing, slowest_count=5):
+    """Reduce raw Navigation/Resource Timing entries to per-page metrics"""
+    navigation = raw_timing.get('navigation') or {}
+    resources = raw_timing.get('resources') or []
+
+    def nav_delta(end, start):
+        if end in navigation and start in navigation:
+            return round(navigation[end] - navigation[start], 2)
+        return None
+
+    by_type = {}
+    for resource in resources:
+        bucket = by_type.setdefault(resource.get('initiatorType') or 'other', {
+            'count': 0, 'transfer_size': 0, 'duration': 0.0
+        })
+        bucket['count'] += 1
+        bucket['transfer_size'] += resource.get('transferSize', 0)
+        bucket['duration'] = round(bucket['duration'] + resource.get('duration', 0), 2)
+
+    slowest = sorted(resources, key=lambda r: r.get('duration', 0), reverse=True)[:slowest_count]
+    resource_bytes = sum(r.get('transferSize', 0) for r in resources)
+
+    return {
+        'dns': nav_delta('domainLookupEnd', 'domainLookupStart'),
+        'connect': nav_delta('connectEnd', 'connectStart'),
+        'ttfb': nav_delta('responseStart', 'requestStart'),
+        'response': nav_delta('responseEnd', 'responseStart'),
+        'dom_interactive': navigation.get('domInteractive'),
+        'dom_content_loaded': navigation.get('domContentLoadedEventEnd'),
+        'load_event_end': navigation.get('loadEventEnd'),
+        'document_transfer_size': navigation.get('transferSize', 0),
+        'resource_count': len(resources),
+        'resource_transfer_size': resource_bytes,
+        'total_transfer_size': navigation.get('transferSize', 0) + resource_bytes,
+        'resources_by_type': by_type,
+        'slowest_resources': [
+            {'name': r.get('name'), 'type': r.get('initiatorType'), 'duration': round(r.get('duration', 0), 2)}
+            for r in slowest
+        ],
+    }
+
+
+def _host_patterns(*hosts):
+    # Chrome looks for the pieces between '*' in order anywhere in the URL, so each
+    # pattern must carry "://" or "." before the host to avoid look-alike domains
+    patterns = []
+    for host in hosts:
+        patterns.extend([f'*://{host}/*', f'*://*.{host}/*'])
+    return patterns
+
+
+# Profile resource types mapped to DevTools Network.ResourceType values; these are
+# intercepted with the Fetch domain, which matches on the request's real type
+# rather than on its URL
+CDP_RESOURCE_TYPES = {
+    'image': 'Image',
+    'font': 'Font',
+    'media': 'Media',
+    'stylesheet': 'Stylesheet',
+}
+
+# Host patterns for Network.setBlockedURLs
+ANALYTICS_URL_PATTERNS = _host_patterns(
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'facebook.net', 'hotjar.com', 'segment.io', 'segment.com', 'mixpanel.com',
+)
+
+BLOCKING_PROFILES = {
+    'none': {'resource_types': [], 'url_patterns': []},
+    'media': {'resource_types': ['image', 'font', 'media'], 'url_patterns': []},
+    'analytics': {'resource_types': [], 'url_patterns': ANALYTICS_URL_PATTERNS},
+    'lean': {'resource_types': ['image', 'font', 'media'], 'url_patterns': ANALYTICS_URL_PATTERNS},
+}
+
+LEAN_BROWSER_ARGUMENTS = [
+    '--headless=new',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--window-size=1920,1080',
+]
+
+
+def _resolve_profile(profile):
+    if isinstance(profile, str):
+        if profile not in BLOCKING_PROFILES:
+            raise ValueError(f"Unknown blocking profile: {profile}")
+        profile = BLOCKING_PROFILES[profile]
+    for resource_type in profile.get('resource_types', []):
+        if resource_type not in CDP_RESOURCE_TYPES:
+            raise ValueError(f"Unknown resource type: {resource_type}")
+    return profile
+
+
+def blocked_url_patterns(profile):
+    """URL patterns of a blocking profile (name or dict) for Network.setBlockedURLs"""
+    return list(_resolve_profile(profile).get('url_patterns', []))
+
+
+def fetch_request_patterns(profile):
+    """Fetch.enable request patterns that pause every request of the profile's resource types"""
+    return [
+        {'urlPattern': '*', 'resourceType': CDP_RESOURCE_TYPES[resource_type], 'requestStage': 'Request'}
+        for resource_type in _resolve_profile(profile).get('resource_types', [])
+    ]
+
+
+def url_matches_pattern(url, pattern):
+    """
+    Match a URL the way Chrome matches Network.setBlockedURLs patterns: the
+    pieces between '*' must appear in order, anywhere in the URL, unanchored.
+    """
+    position = 0
+    for piece in pattern.split('*'):
+        if not piece:
+            continue
+        position = url.find(piece, position)
+        if position < 0:
+            return False
+        position += len(piece)
+    return True
+
+
+def is_url_blocked(url, profile):
+    """Whether a profile's URL patterns would block `url` (resource types are matched by Chrome itself)"""
+    return any(url_matches_pattern(url, pattern) for pattern in blocked_url_patterns(profile))
+
+
+def summarize_network_log(log_entries):
+    """Total encoded bytes received and requests blocked, from Chrome's performance log"""
+    received = 0
+    blocked = 0
+    for entry in log_entries:
+        message = json.loads(entry['message'])['message']
+        if message.get('method') == 'Network.loadingFinished':
+            received += message['params'].get('encodedDataLength', 0)
+        elif message.get('method') == 'Network.loadingFailed':
+            params = message['params']
+            if params.get('blockedReason') or params.get('errorText') == 'net::ERR_BLOCKED_BY_CLIENT':
+                blocked += 1
+    return {'transfer_bytes': int(received), 'blocked_requests': blocked}
+
+
+def summarize_blocking_savings(profile_samples, baseline='none'):
+    """
+    Compare each blocking profile against the baseline using the median of
+    its page loads, so a single noisy load cannot decide the result.
+    """
+    medians = {}
+    for profile, samples in profile_samples.items():
+        if samples:
+            medians[profile] = {
+                'load_time_ms': statistics.median(s['load_time_ms'] for s in samples),
+                'transfer_bytes': statistics.median(s['transfer_bytes'] for s in samples),
+                'blocked_requests': statistics.median(s.get('blocked_requests', 0) for s in samples),
+                'runs': len(samples),
+            }
+
+    base = medians.get(baseline)
+    report = {}
+    for profile, entry in medians.items():
+        if base:
+            base_load = base['load_time_ms']
+            base_transfer = base['transfer_bytes']
+            load_saved = base_load - entry['load_time_ms']
+            bytes_saved = base_transfer - entry['transfer_bytes']
+            entry['load_time_saved_ms'] = round(load_saved, 2)
+            entry['bytes_saved'] = bytes_saved
+            entry['load_time_saved_pct'] = round(100 * load_saved / base_load, 1) if base_load else 0.0
+            entry['bytes_saved_pct'] = round(100 * bytes_saved / base_transfer, 1) if base_transfer else 0.0
+        report[profile] = entry
+    return report
+
+
+class ResourceTypeBlocker:
+    """
+    Fails requests of the given DevTools resource types.
+
+    Fetch.enable pauses matching requests and each one has to be answered with
+    Fetch.failRequest, which needs a live event stream. Selenium only offers
+    that through its async bidi_connection, so it runs on a background thread.
+    """
+
+    def __init__(self, driver, request_patterns):
+        self.driver = driver
+        self.request_patterns = request_patterns
+        self._ready = threading.Event()
+        self._thread = None
+        self._trio_token = None
+        self._cancel_scope = None
+        self._error = None
+
+    def start(self, timeout=10):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutException("Request interception did not start")
+        if self._error:
+            raise self._error
+
+    def stop(self, timeout=5):
+        if self._trio_token and self._cancel_scope:
+            try:
+                self._trio_token.run_sync_soon(self._cancel_scope.cancel)
+            except RuntimeError:
+                pass  # the event loop has already finished
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        import trio
+
+        try:
+            trio.run(self._intercept)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._ready.set()
+
+    async def _intercept(self):
+        import trio
+
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            patterns = [devtools.fetch.RequestPattern.from_json(p) for p in self.request_patterns]
+            await session.execute(devtools.fetch.enable(patterns=patterns))
+            paused_requests = session.listen(devtools.fetch.RequestPaused, buffer_size=256)
+            with trio.CancelScope() as cancel_scope:
+                self._cancel_scope = cancel_scope
+                self._trio_token = trio.lowlevel.current_trio_token()
+                self._ready.set()
+                async for event in paused_requests:
+                    await session.execute(devtools.fetch.fail_request(
+                        event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT
+                    ))
+
+
 class AITestAutomation:
-    def __init__(self):
+    def __init__(self, readiness_mode='ready_state', quiet_window_ms=500,
+                 network_idle_ms=500, performance_log=None,
+                 lean_browser=False, blocking_profile=None, watch_attributes=False):
         self.driver = None
         self.wait = None
+        self.resource_blocker = None
+        # Lean mode runs headless Chrome without extensions/GPU; blocking drops matching requests
+        self.lean_browser = lean_browser
+        self.blocking_profile = blocking_profile
+        # 'ready_state' polls document.readyState; 'observer' waits for network idle and DOM quiet
+        self.readiness_mode = readiness_mode
+        self.quiet_window_ms = quiet_window_ms
+        self.network_idle_ms = network_idle_ms
+        # Attribute/text changes (spinners, carousels, clocks) only count as DOM activity on request
+        self.watch_attributes = watch_attributes
+        self.performance_log = performance_log
+        self.performance_results = []
     
-    def setup_browser(self):
+    def setup_browser(self, lean=None, blocking_profile=None, capture_network=False):
         """Initialize the browser driver"""
+        lean = self.lean_browser if lean is None else lean
+        blocking_profile = blocking_profile or self.blocking_profile
+        try:
+            # Validate the profile before Chrome starts so a bad one cannot leak a browser
+            _resolve_profile(blocking_profile or 'none')
+        except ValueError as e:
+            print(f"Browser setup failed: {e}")
+            return False
         try:
-            self.driver = webdriver.Chrome()
+            options = webdriver.ChromeOptions()
+            if lean:
+                for argument in LEAN_BROWSER_ARGUMENTS:
+                    options.add_argument(argument)
+            if capture_network:
+                # Network.* events in the performance log carry real byte counts, unlike
+                # Resource Timing which reports 0 for cross-origin responses
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            self.driver = webdriver.Chrome(options=options)
             self.wait = WebDriverWait(self.driver, 10)
-            self.driver.maximize_window()
+            if not lean:
+                self.driver.maximize_window()
+            if blocking_profile:
+                self.apply_blocking_profile(blocking_profile)
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                'source': RESOURCE_TIMING_BUFFER_SCRIPT.replace('__BUFFER_SIZE__', str(RESOURCE_TIMING_BUFFER_SIZE))
+            })
+            if self.readiness_mode == 'observer':
+                self.install_readiness_instrumentation()
             return True
         except Exception as e:
             print(f"Browser setup failed: {e}")
+            self.cleanup()
             return False
+
+    def apply_blocking_profile(self, profile):
+        """Block analytics hosts by URL and resource types by request type through DevTools"""
+        url_patterns = blocked_url_patterns(profile)
+        if url_patterns:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': url_patterns})
+
+        request_patterns = fetch_request_patterns(profile)
+        if request_patterns:
+            self.resource_blocker = ResourceTypeBlocker(self.driver, request_patterns)
+            self.resource_blocker.start()
+
+    def collect_network_usage(self):
+        """Bytes received and requests blocked since the last call (needs capture_network)"""
+        return summarize_network_log(self.driver.get_log('performance'))
+
+    def install_readiness_instrumentation(self):
+        """Register the readiness tracker to run in every new document before page scripts"""
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': readiness_instrumentation_script(self.watch_attributes)
+        })
     
     def ai_element_finder(self, element_description):
         """
@@ -65,8 +487,14 @@ class AITestAutomation:
         print(f"Could not locate element: {element_description}")
         return None
     
-    def smart_wait_for_page_load(self, timeout=30):
+    def smart_wait_for_page_load(self, timeout=30, mode=None):
         """AI-inspired page load detection"""
+        mode = mode or self.readiness_mode
+        if mode == 'observer':
+            return self._wait_for_quiet_page(timeout)
+        if mode != 'ready_state':
+            raise ValueError(f"Unknown readiness mode: {mode}")
+
         try:
             WebDriverWait(self.driver, timeout).until(
                 lambda driver: driver.execute_script('return document.readyState') == 'complete'
@@ -75,28 +503,70 @@ class AITestAutomation:
         except TimeoutException:
             print("Page load timeout")
             return False
+
+    def _wait_for_quiet_page(self, timeout):
+        """Wait in-page until the network is idle and the DOM has stopped changing"""
+        previous_timeout = self.driver.timeouts.script
+        try:
+            self.driver.set_script_timeout(timeout)
+            quiet = self.driver.execute_async_script(
+                PAGE_QUIET_WAIT_SCRIPT, self.quiet_window_ms, self.network_idle_ms
+            )
+        except TimeoutException:
+            print("Page did not become quiet before timeout")
+            return False
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if quiet is None:
+            print("Readiness instrumentation not installed; falling back to document.readyState")
+            return self.smart_wait_for_page_load(timeout, mode='ready_state')
+        return bool(quiet)
+
+    def collect_performance_metrics(self):
+        """Collect Navigation Timing and Resource Timing metrics for the current page"""
+        try:
+            raw_timing = self.driver.execute_script(PERFORMANCE_TIMING_SCRIPT)
+        except Exception as e:
+            print(f"Performance metrics unavailable: {e}")
+            return None
+        return summarize_performance_timing(raw_timing or {})
+
+    def record_test_result(self, test_name, url, passed, metrics):
+        """Store a test result together with the page's performance data"""
+        result = {
+            'test': test_name,
+            'url': url,
+            'passed': passed,
+            'timestamp': time.time(),
+            'performance': metrics,
+        }
+        self.performance_results.append(result)
+        if self.performance_log:
+            with open(self.performance_log, 'a', encoding='utf-8') as log_file:
+                log_file.write(json.dumps(result) + '\n')
+        return result
     
-    def generate_test_data(self, data_type, count=5):
+    def generate_test_data(self, data_type, count=5, seed=None):
         """Generate test data using AI principles"""
-        test_data = {
-            'emails': [f'testuser{i}@example.com' for i in range(count)],
-            'usernames': [f'test_user_{i}' for i in range(count)],
-            'passwords': [f'TestPass123!{i}' for i in range(count)],
-            'names': [f'Test User {i}' for i in range(count)]
-        }
-        return test_data.get(data_type, [])
+        if data_type not in AIDataGenerator.DATA_TYPES:
+            return []
+        return AIDataGenerator(seed).generate(data_type, count)
     
     def run_basic_navigation_test(self, url):
         """Execute a basic navigation test"""
         if not self.setup_browser():
             return False
         
+        passed = False
+        metrics = None
         try:
             print(f"Navigating to: {url}")
             self.driver.get(url)
             
             if not self.smart_wait_for_page_load():
                 return False
+            metrics = self.collect_performance_metrics()
             
             # Try to find common elements
             common_elements = ['login', 'sign in', 'menu', 'search', 'home']
@@ -109,18 +579,45 @@ class AITestAutomation:
                     print(f"Successfully located: {element_text}")
             
             print(f"Found {len(found_elements)} common elements: {found_elements}")
-            return len(found_elements) > 0
+            passed = len(found_elements) > 0
+            return passed
             
         except Exception as e:
             print(f"Navigation test failed: {e}")
             return False
         finally:
+            self.record_test_result('basic_navigation', url, passed, metrics)
             self.cleanup()
     
+    def compare_blocking_profiles(self, url, profiles=('none', 'media', 'analytics', 'lean'), runs=5):
+        """Load a page `runs` times under each blocking profile and report median time and bandwidth saved"""
+        profile_samples = {}
+        for profile in profiles:
+            samples = profile_samples.setdefault(profile, [])
+            for _ in range(runs):
+                # A fresh browser per load keeps the HTTP cache from favouring later runs
+                if not self.setup_browser(blocking_profile=profile, capture_network=True):
+                    break
+                try:
+                    self.driver.get(url)
+                    if self.smart_wait_for_page_load():
+                        metrics = self.collect_performance_metrics()
+                        if metrics and metrics['load_event_end'] is not None:
+                            samples.append({'load_time_ms': metrics['load_event_end'], **self.collect_network_usage()})
+                except Exception as e:
+                    print(f"Profile '{profile}' run failed: {e}")
+                finally:
+                    self.cleanup()
+        return summarize_blocking_savings(profile_samples)
+    
     def cleanup(self):
         """Clean up browser resources"""
+        if self.resource_blocker:
+            self.resource_blocker.stop()
+            self.resource_blocker = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
 
 class TestAIAutomation(unittest.TestCase):
     def setUp(self):
@@ -139,6 +636,113 @@ class TestAIAutomation(unittest.TestCase):
             (By.XPATH, "//*[@placeholder='test']")
         ]
         self.assertEqual(len(strategies), 2)
+    
+    def test_performance_timing_summary(self):
+        """Test Navigation/Resource Timing entries are summarized per page"""
+        raw_timing = {
+            'navigation': {'requestStart': 10, 'responseStart': 60, 'responseEnd': 80,
+                           'domContentLoadedEventEnd': 300, 'loadEventEnd': 450, 'transferSize': 1000},
+            'resources': [
+                {'name': 'a.png', 'initiatorType': 'img', 'duration': 120, 'transferSize': 4000},
+                {'name': 'b.js', 'initiatorType': 'script', 'duration': 40, 'transferSize': 2000},
+            ]
+        }
+        metrics = summarize_performance_timing(raw_timing)
+        self.assertEqual(metrics['ttfb'], 50)
+        self.assertEqual(metrics['resource_count'], 2)
+        self.assertEqual(metrics['total_transfer_size'], 7000)
+        self.assertEqual(metrics['resources_by_type']['img']['count'], 1)
+        self.assertEqual(metrics['slowest_resources'][0]['name'], 'a.png')
+    
+    def test_blocking_profile_patterns(self):
+        """Test that profiles split into host URL patterns and Fetch resource-type patterns"""
+        self.assertEqual(blocked_url_patterns('media'), [])
+        self.assertIn('*://*.google-analytics.com/*', blocked_url_patterns('lean'))
+        resource_types = [p['resourceType'] for p in fetch_request_patterns('lean')]
+        self.assertEqual(resource_types, ['Image', 'Font', 'Media'])
+        self.assertEqual(fetch_request_patterns('analytics'), [])
+        with self.assertRaises(ValueError):
+            blocked_url_patterns('unknown')
+    
+    def test_url_patterns_use_chrome_matching(self):
+        """Test URL patterns under Chrome's unanchored in-order matching"""
+        self.assertTrue(url_matches_pattern('https://cdn.example.com/bundle.woff2.js', '*.woff*'))
+        self.assertTrue(is_url_blocked('https://cdn.segment.com/analytics.js', 'analytics'))
+        self.assertTrue(is_url_blocked('https://segment.com/v1/track', 'analytics'))
+        self.assertFalse(is_url_blocked('https://api.mysegment.com/v1/data', 'analytics'))
+        self.assertFalse(is_url_blocked('https://notgoogle-analytics.com/collect', 'analytics'))
+        # Resource types are blocked by request type, so first-party URLs never match by name
+        for url in ('https://api.gifts.com/orders', 'https://www.icons8.com/app.js',
+                    'https://cdn.example.com/bundle.woff2.js'):
+            self.assertFalse(is_url_blocked(url, 'lean'))
+    
+    def test_invalid_blocking_profile_does_not_start_browser(self):
+        """Test bad custom profiles are rejected before Chrome launches"""
+        started = []
+        original_chrome = webdriver.Chrome
+        webdriver.Chrome = lambda *args, **kwargs: started.append(True)
+        try:
+            self.assertFalse(self.ai_tester.setup_browser(blocking_profile={'resource_types': ['bogus']}))
+        finally:
+            webdriver.Chrome = original_chrome
+        self.assertEqual(started, [])
+    
+    def test_network_log_counts_bytes_and_blocked_requests(self):
+        """Test bytes come from Network.loadingFinished events, not Resource Timing"""
+        def log_entry(method, **params):
+            return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+        
+        usage = summarize_network_log([
+            log_entry('Network.loadingFinished', encodedDataLength=1200),
+            log_entry('Network.loadingFinished', encodedDataLength=800.0),
+            log_entry('Network.loadingFailed', errorText='net::ERR_BLOCKED_BY_CLIENT'),
+            log_entry('Network.loadingFailed', errorText='net::ERR_FAILED'),
+            log_entry('Network.requestWillBeSent'),
+        ])
+        self.assertEqual(usage, {'transfer_bytes': 2000, 'blocked_requests': 1})
+    
+    def test_blocking_savings_report(self):
+        """Test savings use the median of several loads against the unblocked baseline"""
+        report = summarize_blocking_savings({
+            'none': [{'load_time_ms': t, 'transfer_bytes': 100000} for t in (1900, 2000, 9000)],
+            'lean': [{'load_time_ms': t, 'transfer_bytes': 25000, 'blocked_requests': 12} for t in (400, 500, 600)],
+        })
+        self.assertEqual(report['lean']['load_time_saved_ms'], 1500)
+        self.assertEqual(report['lean']['bytes_saved'], 75000)
+        self.assertEqual(report['lean']['bytes_saved_pct'], 75.0)
+        self.assertEqual(report['lean']['runs'], 3)
+        self.assertEqual(report['none']['bytes_saved'], 0)
+    
+    def test_readiness_instrumentation_attribute_watching(self):
+        """Test attribute/text mutations are only observed when opted in"""
+        default_script = readiness_instrumentation_script()
+        self.assertIn('attributes: false', default_script)
+        self.assertIn('characterData: false', default_script)
+        self.assertIn('attributes: true', readiness_instrumentation_script(watch_attributes=True))
+        self.assertNotIn('__WATCH_ATTRIBUTES__', default_script)
+    
+    def test_quiet_wait_restores_script_timeout(self):
+        """Test the observer wait leaves the driver's script timeout unchanged"""
+        class FakeTimeouts:
+            script = 30
+        
+        class FakeDriver:
+            timeouts = FakeTimeouts()
+            
+            def set_script_timeout(self, seconds):
+                self.timeouts.script = seconds
+            
+            def execute_async_script(self, script, *args):
+                raise TimeoutException()
+        
+        self.ai_tester.driver = FakeDriver()
+        self.assertFalse(self.ai_tester.smart_wait_for_page_load(timeout=5, mode='observer'))
+        self.assertEqual(self.ai_tester.driver.timeouts.script, 30)
+    
+    def test_unknown_readiness_mode(self):
+        """Test that an unsupported readiness mode is rejected"""
+        with self.assertRaises(ValueError):
+            self.ai_tester.smart_wait_for_page_load(mode='bogus')
 
 if __name__ == "__main__":
     # Run unit tests
@@ -156,6 +760,8 @@ if __name__ == "__main__":
     success = ai_tester.run_basic_navigation_test(test_url)
     
     print(f"\nTest Result: {'PASSED' if success else 'FAILED'}")
+    for result in ai_tester.performance_results:
+        print(f"Performance: {json.dumps(result['performance'], indent=2)}")
     
     # Demonstrate test data generation
     print("\nGenerated Test Data:")
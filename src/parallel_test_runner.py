@@ -0,0 +1,435 @@
+"""
+Parallel Test Sharding Module
+Splits the test suite into timing-balanced shards and runs them in worker processes
+"""
+
+import argparse
+import heapq
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+
+DEFAULT_TEST_PATHS = ['tests', os.path.join('src', 'ai_test_automation.py')]
+DEFAULT_HISTORY_FILE = os.path.join(PROJECT_ROOT, '.test_timings.json')
+DEFAULT_DURATION = 1.0
+
+# Worker processes load this module as a pytest plugin and append results here
+RESULTS_ENV = 'PARALLEL_TEST_RESULTS'
+
+FAILING_OUTCOMES = ('failed', 'error')
+LOG_TAIL_LINES = 40
+
+
+def pytest_runtest_logreport(report):
+    """pytest hook: stream each test phase result to the shard's results file"""
+    results_path = os.environ.get(RESULTS_ENV)
+    if not results_path:
+        return
+    entry = {
+        'nodeid': report.nodeid,
+        'when': report.when,
+        'outcome': report.outcome,
+        'duration': report.duration,
+        'message': str(report.longrepr) if report.failed else '',
+    }
+    with open(results_path, 'a', encoding='utf-8') as results_file:
+        results_file.write(json.dumps(entry) + '\n')
+
+
+def pytest_collectreport(report):
+    """pytest hook: record modules that fail to import as collection errors"""
+    if report.failed:
+        pytest_runtest_logreport(_CollectionFailure(report))
+
+
+class _CollectionFailure:
+    """Adapts a failed collection report to the fields logged for test phases"""
+
+    def __init__(self, report):
+        self.nodeid = report.nodeid
+        self.when = 'collect'
+        self.outcome = 'failed'
+        self.duration = 0.0
+        self.longrepr = report.longrepr
+        self.failed = True
+
+
+def _read_entries(results_path):
+    if not os.path.exists(results_path):
+        return []
+    with open(results_path, encoding='utf-8') as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+def _log_tail(log_path, line_count=LOG_TAIL_LINES):
+    try:
+        with open(log_path, encoding='utf-8', errors='replace') as log_file:
+            return ''.join(log_file.readlines()[-line_count:])
+    except OSError:
+        return ''
+
+
+class TimingHistory:
+    """Per-test durations and last outcomes persisted between runs"""
+
+    def __init__(self, path=DEFAULT_HISTORY_FILE, smoothing=0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.tests = {}
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as history_file:
+                    self.tests = json.load(history_file).get('tests', {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable timing history: {e}")
+                self.tests = {}
+        return self
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as history_file:
+            json.dump({'updated': time.time(), 'tests': self.tests}, history_file, indent=2, sort_keys=True)
+
+    def duration(self, nodeid, default=None):
+        entry = self.tests.get(nodeid)
+        if not entry or entry['duration'] is None:
+            return default
+        return entry['duration']
+
+    def update(self, results):
+        """
+        Blend new durations into the history and remember each test's outcome.
+
+        Synthetic results (worker or pytest failures that are not tests) are
+        skipped. Results without a measured duration keep the previous timing,
+        so a crash does not distort the shard balance.
+        """
+        for result in results:
+            if result.get('synthetic'):
+                continue
+            entry = self.tests.get(result['nodeid'])
+            previous = entry['duration'] if entry else None
+            duration = result['duration']
+            if duration is None:
+                duration = previous
+            elif previous is not None:
+                duration = self.smoothing * duration + (1 - self.smoothing) * previous
+            self.tests[result['nodeid']] = {
+                'duration': None if duration is None else round(duration, 4),
+                'outcome': result['outcome'],
+                'runs': (entry['runs'] if entry else 0) + 1,
+            }
+
+    def failed_tests(self):
+        return {nodeid for nodeid, entry in self.tests.items() if entry['outcome'] in FAILING_OUTCOMES}
+
+    def discard(self, nodeids):
+        for nodeid in nodeids:
+            self.tests.pop(nodeid, None)
+
+
+def balance_shards(test_ids, durations, shard_count, default_duration=DEFAULT_DURATION):
+    """
+    Split tests into shards with roughly equal total duration.
+
+    Uses longest-processing-time-first: the slowest remaining test always goes
+    to the currently lightest shard. Tests without history get the median
+    known duration (or `default_duration` when nothing is known yet).
+    """
+    shard_count = max(1, min(shard_count, len(test_ids)))
+    known = sorted(d for d in (durations.get(t) for t in test_ids) if d is not None)
+    fallback = known[len(known) // 2] if known else default_duration
+    order = {test_id: position for position, test_id in enumerate(test_ids)}
+
+    def estimate(test_id):
+        duration = durations.get(test_id)
+        return fallback if duration is None else duration
+
+    heap = [(0.0, index) for index in range(shard_count)]
+    shards = [[] for _ in range(shard_count)]
+    for test_id in sorted(test_ids, key=lambda t: (-estimate(t), order[t])):
+        load, index = heapq.heappop(heap)
+        shards[index].append(test_id)
+        heapq.heappush(heap, (load + estimate(test_id), index))
+
+    # Keep collection order inside each shard so module-level fixtures are reused
+    return [sorted(shard, key=order.get) for shard in shards if shard]
+
+
+def aggregate_phase_results(entries):
+    """Combine setup/call/teardown phase reports into one result per test"""
+    results = {}
+    for entry in entries:
+        result = results.setdefault(entry['nodeid'], {
+            'nodeid': entry['nodeid'], 'outcome': 'passed', 'duration': 0.0, 'message': ''
+        })
+        result['duration'] += entry['duration']
+        if entry['outcome'] == 'failed':
+            result['outcome'] = 'failed' if entry['when'] == 'call' else 'error'
+            result['message'] = entry['message']
+        elif entry['outcome'] == 'skipped' and result['outcome'] == 'passed':
+            result['outcome'] = 'skipped'
+    return list(results.values())
+
+
+def _git_lines(*args):
+    try:
+        completed = subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [line.strip() for line in completed.stdout.splitlines() if line.strip()]
+
+
+def changed_files():
+    """Files modified relative to HEAD, including untracked ones"""
+    return set(_git_lines('diff', '--name-only', 'HEAD')) | set(_git_lines('ls-files', '--others', '--exclude-standard'))
+
+
+def _imports_module(file_path, module):
+    try:
+        with open(os.path.join(PROJECT_ROOT, file_path), encoding='utf-8') as source_file:
+            source = source_file.read()
+    except OSError:
+        return False
+    return re.search(rf'^\s*(from|import)\s+{re.escape(module)}\b', source, re.MULTILINE) is not None
+
+
+def affected_tests(test_ids, changed):
+    """Tests living in a changed file or importing (directly or indirectly) a changed src module"""
+    changed = {path.replace(os.sep, '/') for path in changed}
+    src_files = [f"src/{name}" for name in os.listdir(SRC_DIR) if name.endswith('.py')]
+    changed_modules = {os.path.splitext(os.path.basename(p))[0] for p in changed if p.startswith('src/') and p.endswith('.py')}
+
+    # Propagate through src modules that import changed modules
+    pending = set(changed_modules)
+    while pending:
+        module = pending.pop()
+        for src_file in src_files:
+            name = os.path.splitext(os.path.basename(src_file))[0]
+            if name not in changed_modules and _imports_module(src_file, module):
+                changed_modules.add(name)
+                pending.add(name)
+
+    selected = []
+    for test_id in test_ids:
+        test_file = test_id.split('::', 1)[0]
+        test_module = os.path.splitext(os.path.basename(test_file))[0]
+        if (test_file in changed or test_module in changed_modules
+                or any(_imports_module(test_file, module) for module in changed_modules)):
+            selected.append(test_id)
+    return selected
+
+
+class ParallelTestRunner:
+    def __init__(self, paths=None, shard_count=None, history_file=DEFAULT_HISTORY_FILE):
+        self.paths = paths or DEFAULT_TEST_PATHS
+        self.shard_count = shard_count or os.cpu_count() or 1
+        self.history = TimingHistory(history_file).load()
+        self.collection_failed = False
+
+    def _env(self, results_path=None):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_DIR, env.get('PYTHONPATH')]))
+        if results_path:
+            env[RESULTS_ENV] = results_path
+        return env
+
+    def collect_tests(self):
+        """
+        Ask pytest for the node ids of every test under the configured paths.
+
+        Returns the collected node ids together with one `error` result per
+        module that could not be collected, so broken modules stay visible.
+        """
+        with tempfile.TemporaryDirectory() as work_dir:
+            results_path = os.path.join(work_dir, 'collect.jsonl')
+            completed = subprocess.run(
+                [sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider',
+                 '-p', 'parallel_test_runner', *self.paths],
+                cwd=PROJECT_ROOT, env=self._env(results_path), capture_output=True, text=True
+            )
+            errors = aggregate_phase_results(_read_entries(results_path))
+
+        test_ids = []
+        for line in completed.stdout.splitlines():
+            line = line.strip()
+            if '::' in line and not line.startswith(('ERROR', 'FAILED')):
+                test_ids.append(line)
+
+        self.collection_failed = completed.returncode not in (0, 5)
+        if self.collection_failed and not errors:
+            # pytest itself failed (bad arguments, plugin error) before reporting any module
+            errors = [{
+                'nodeid': 'pytest::collection', 'outcome': 'error', 'duration': None, 'synthetic': True,
+                'message': (completed.stdout + completed.stderr)[-4000:],
+            }]
+        for error in errors:
+            print(f"Collection error: {error['nodeid']}")
+        return test_ids, errors
+
+    def select_tests(self, test_ids, failed_only=False, affected_only=False):
+        if not (failed_only or affected_only):
+            return test_ids
+        selected = set()
+        if failed_only:
+            # Modules that failed to collect last time are recorded by file path
+            failed = self.history.failed_tests()
+            selected |= {t for t in test_ids if t in failed or t.split('::', 1)[0] in failed}
+        if affected_only:
+            selected |= set(affected_tests(test_ids, changed_files()))
+        return [test_id for test_id in test_ids if test_id in selected]
+
+    def _shard_results(self, index, shard, returncode, entries, log_path):
+        """Turn a worker's reports into results, flagging tests the worker never reached"""
+        # pytest always logs a teardown phase, so a test without one was cut off mid-run
+        finished = {entry['nodeid'] for entry in entries if entry['when'] == 'teardown'}
+        results = [r for r in aggregate_phase_results(entries) if r['nodeid'] in finished]
+        missing = [test_id for test_id in shard if test_id not in finished]
+        if missing or (returncode != 0 and not any(r['outcome'] in FAILING_OUTCOMES for r in results)):
+            message = (f"Worker for shard {index} exited with code {returncode}\n"
+                       f"{_log_tail(log_path)}")
+            for test_id in missing:
+                # The worker never timed these tests, so leave their duration unknown
+                results.append({'nodeid': test_id, 'outcome': 'error', 'duration': None, 'message': message})
+            if not missing:
+                results.append({
+                    'nodeid': f'parallel_test_runner::shard_{index}', 'outcome': 'error',
+                    'duration': None, 'message': message, 'synthetic': True,
+                })
+        return results
+
+    def run_shards(self, shards):
+        """Start one pytest worker process per shard and collect their results"""
+        with tempfile.TemporaryDirectory() as work_dir:
+            workers = []
+            for index, shard in enumerate(shards):
+                results_path = os.path.join(work_dir, f'shard_{index}.jsonl')
+                log_path = os.path.join(work_dir, f'shard_{index}.log')
+                log_file = open(log_path, 'w', encoding='utf-8')
+                process = subprocess.Popen(
+                    [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+                     '-p', 'parallel_test_runner', *shard],
+                    cwd=PROJECT_ROOT, env=self._env(results_path),
+                    stdout=log_file, stderr=subprocess.STDOUT
+                )
+                workers.append((index, shard, process, log_file, results_path, log_path))
+
+            results = []
+            for index, shard, process, log_file, results_path, log_path in workers:
+                returncode = process.wait()
+                log_file.close()
+                results.extend(self._shard_results(
+                    index, shard, returncode, _read_entries(results_path), log_path
+                ))
+        return results
+
+    def run(self, failed_only=False, affected_only=False, report_path=None):
+        collected, collection_errors = self.collect_tests()
+
+        # Modules that failed to collect before but collect cleanly now are no longer failing
+        error_ids = {error['nodeid'] for error in collection_errors}
+        collected_files = {test_id.split('::', 1)[0] for test_id in collected}
+        self.history.discard(
+            nodeid for nodeid in self.history.failed_tests()
+            if '::' not in nodeid and nodeid in collected_files and nodeid not in error_ids
+        )
+
+        test_ids = self.select_tests(collected, failed_only, affected_only)
+        shards = []
+        results = list(collection_errors)
+        start = time.perf_counter()
+        if test_ids:
+            durations = {test_id: self.history.duration(test_id) for test_id in test_ids}
+            shards = balance_shards(test_ids, durations, self.shard_count)
+            print(f"Running {len(test_ids)} tests in {len(shards)} shards")
+            results.extend(self.run_shards(shards))
+        else:
+            print("No tests selected")
+        wall_time = time.perf_counter() - start
+
+        self.history.update(results)
+        self.history.save()
+
+        report = {
+            'results': results,
+            'shards': shards,
+            'wall_time': round(wall_time, 3),
+            'collection_failed': self.collection_failed,
+        }
+        if results:
+            print(format_report(report))
+            if report_path:
+                write_junit_report(report, report_path)
+        return report
+
+
+def format_report(report):
+    """Render a merged, human-readable summary of all shards"""
+    counts = {}
+    for result in report['results']:
+        counts[result['outcome']] = counts.get(result['outcome'], 0) + 1
+    serial_time = sum(result['duration'] or 0.0 for result in report['results'])
+
+    lines = ["=" * 50, "PARALLEL TEST REPORT", "=" * 50]
+    for outcome in ('passed', 'failed', 'error', 'skipped'):
+        lines.append(f"{outcome.capitalize()}: {counts.get(outcome, 0)}")
+    lines.append(f"Shards: {len(report['shards'])}")
+    lines.append(f"Wall time: {report['wall_time']:.2f}s (serial test time {serial_time:.2f}s)")
+    for result in report['results']:
+        if result['outcome'] in FAILING_OUTCOMES:
+            lines.append(f"\n{result['outcome'].upper()}: {result['nodeid']}\n{result['message']}")
+    return '\n'.join(lines)
+
+
+def write_junit_report(report, path):
+    """Write the merged results of all shards as a single JUnit XML file"""
+    results = report['results']
+    suite = ET.Element('testsuite', {
+        'name': 'parallel',
+        'tests': str(len(results)),
+        'failures': str(sum(r['outcome'] == 'failed' for r in results)),
+        'errors': str(sum(r['outcome'] == 'error' for r in results)),
+        'skipped': str(sum(r['outcome'] == 'skipped' for r in results)),
+        'time': f"{report['wall_time']:.3f}",
+    })
+    for result in results:
+        classname, _, name = result['nodeid'].rpartition('::')
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': classname.replace('::', '.'),
+            'name': name,
+            'time': f"{result['duration'] or 0.0:.3f}",
+        })
+        if result['outcome'] in ('failed', 'error'):
+            ET.SubElement(case, 'failure' if result['outcome'] == 'failed' else 'error').text = result['message']
+        elif result['outcome'] == 'skipped':
+            ET.SubElement(case, 'skipped')
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the test suite in timing-balanced parallel shards")
+    parser.add_argument('paths', nargs='*', help="Test files or directories (default: whole suite)")
+    parser.add_argument('-n', '--shards', type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--failed', action='store_true', help="Only rerun tests that failed last time")
+    parser.add_argument('--affected', action='store_true', help="Only run tests affected by uncommitted changes")
+    parser.add_argument('--history', default=DEFAULT_HISTORY_FILE, help="Timing history file")
+    parser.add_argument('--report', help="Write merged JUnit XML report to this path")
+    args = parser.parse_args(argv)
+
+    runner = ParallelTestRunner(args.paths, args.shards, args.history)
+    report = runner.run(args.failed, args.affected, args.report)
+    failed = report['collection_failed'] or any(r['outcome'] in FAILING_OUTCOMES for r in report['results'])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
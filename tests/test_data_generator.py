@@ -0,0 +1,76 @@
+"""
+Test cases for the streaming test data generator
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_generator import AIDataGenerator, RECORD_FIELDS
+
+class TestAIDataGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = AIDataGenerator(seed=1234)
+    
+    def test_seeded_output_is_deterministic(self):
+        """Test that the same seed reproduces the same values"""
+        other = AIDataGenerator(seed=1234)
+        for data_type in AIDataGenerator.DATA_TYPES:
+            self.assertEqual(self.generator.generate(data_type, 20), other.generate(data_type, 20))
+        self.assertNotEqual(self.generator.generate('emails', 20),
+                            AIDataGenerator(seed=99).generate('emails', 20))
+    
+    def test_identifiers_are_unique(self):
+        """Test that emails and usernames never repeat"""
+        for data_type in ('emails', 'usernames'):
+            values = self.generator.generate(data_type, 20000)
+            self.assertEqual(len(set(values)), len(values))
+    
+    def test_iterators_are_lazy(self):
+        """Test that data types are produced on demand"""
+        emails = self.generator.iter_data('emails')
+        email = next(emails)
+        self.assertIn('@', email)
+        self.assertTrue(email.endswith(('example.com', 'example.org', 'example.net')))
+        with self.assertRaises(ValueError):
+            self.generator.iter_data('addresses')
+    
+    def test_password_complexity(self):
+        """Test that passwords contain every required character class"""
+        for password in self.generator.generate('passwords', 200):
+            self.assertGreaterEqual(len(password), 10)
+            self.assertTrue(any(c.isupper() for c in password))
+            self.assertTrue(any(c.islower() for c in password))
+            self.assertTrue(any(c.isdigit() for c in password))
+    
+    def test_export_csv_and_jsonl(self):
+        """Test bulk export writes one row per record"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'users.csv')
+            self.assertEqual(self.generator.export(csv_path, 500), 500)
+            with open(csv_path, newline='', encoding='utf-8') as csv_file:
+                rows = list(csv.reader(csv_file))
+            self.assertEqual(rows[0], RECORD_FIELDS)
+            self.assertEqual(len(rows), 501)
+            
+            jsonl_path = os.path.join(tmp_dir, 'users.jsonl')
+            self.generator.export(jsonl_path, 500)
+            with open(jsonl_path, encoding='utf-8') as jsonl_file:
+                records = [json.loads(line) for line in jsonl_file]
+            self.assertEqual(len(records), 500)
+            self.assertEqual(set(records[0]), set(RECORD_FIELDS))
+    
+    def test_benchmark_reports_throughput(self):
+        """Test benchmark returns records per second"""
+        result = self.generator.benchmark(1000, 'jsonl')
+        self.assertEqual(result['records'], 1000)
+        self.assertGreater(result['records_per_second'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Test cases for the parallel test sharding runner
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parallel_test_runner import (
+    ParallelTestRunner, TimingHistory, aggregate_phase_results, affected_tests, balance_shards
+)
+
+class TestShardBalancing(unittest.TestCase):
+    def test_shards_are_balanced_by_duration(self):
+        """Test that slow tests are spread across shards"""
+        durations = {'a': 8.0, 'b': 7.0, 'c': 3.0, 'd': 2.0, 'e': 1.0, 'f': 1.0}
+        shards = balance_shards(list(durations), durations, 2)
+        totals = sorted(sum(durations[t] for t in shard) for shard in shards)
+        self.assertEqual(totals, [11.0, 11.0])
+        self.assertEqual(sorted(t for shard in shards for t in shard), sorted(durations))
+    
+    def test_unknown_tests_and_shard_count(self):
+        """Test that tests without history are still scheduled"""
+        shards = balance_shards(['a', 'b', 'c'], {'a': None, 'b': None, 'c': None}, 8)
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(balance_shards(['x', 'y'], {}, 1), [['x', 'y']])
+
+class TestTimingHistory(unittest.TestCase):
+    def test_history_round_trip_and_failures(self):
+        """Test that durations and outcomes persist between runs"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'timings.json')
+            history = TimingHistory(path)
+            history.update([
+                {'nodeid': 'tests/t.py::test_ok', 'outcome': 'passed', 'duration': 2.0},
+                {'nodeid': 'tests/t.py::test_bad', 'outcome': 'failed', 'duration': 1.0},
+            ])
+            history.save()
+            
+            reloaded = TimingHistory(path).load()
+            self.assertEqual(reloaded.duration('tests/t.py::test_ok'), 2.0)
+            self.assertEqual(reloaded.failed_tests(), {'tests/t.py::test_bad'})
+            
+            reloaded.update([{'nodeid': 'tests/t.py::test_ok', 'outcome': 'passed', 'duration': 4.0}])
+            self.assertEqual(reloaded.duration('tests/t.py::test_ok'), 3.0)
+
+class TestResultMerging(unittest.TestCase):
+    def test_phase_results_are_combined(self):
+        """Test setup/call/teardown reports merge into one outcome per test"""
+        entries = [
+            {'nodeid': 'a', 'when': 'setup', 'outcome': 'passed', 'duration': 0.1, 'message': ''},
+            {'nodeid': 'a', 'when': 'call', 'outcome': 'failed', 'duration': 0.2, 'message': 'boom'},
+            {'nodeid': 'b', 'when': 'setup', 'outcome': 'failed', 'duration': 0.1, 'message': 'fixture'},
+            {'nodeid': 'c', 'when': 'call', 'outcome': 'passed', 'duration': 0.5, 'message': ''},
+        ]
+        results = {r['nodeid']: r for r in aggregate_phase_results(entries)}
+        self.assertEqual(results['a']['outcome'], 'failed')
+        self.assertAlmostEqual(results['a']['duration'], 0.3)
+        self.assertEqual(results['b']['outcome'], 'error')
+        self.assertEqual(results['c']['outcome'], 'passed')
+    
+    def test_affected_tests_follow_imports(self):
+        """Test that changing a src module selects the tests importing it"""
+        test_ids = [
+            'tests/test_data_generator.py::TestAIDataGenerator::test_iterators_are_lazy',
+            'tests/test_sample.py::test_addition',
+        ]
+        selected = affected_tests(test_ids, {'src/data_generator.py'})
+        self.assertEqual(selected, test_ids[:1])
+
+class TestWorkerFailures(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.runner = ParallelTestRunner(history_file=os.path.join(self.tmp_dir.name, 'timings.json'))
+        self.log_path = os.path.join(self.tmp_dir.name, 'shard_0.log')
+        with open(self.log_path, 'w', encoding='utf-8') as log_file:
+            log_file.write('Fatal Python error: Segmentation fault\n')
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def phases(self, nodeid, *whens):
+        return [{'nodeid': nodeid, 'when': when, 'outcome': 'passed', 'duration': 0.1, 'message': ''}
+                for when in whens]
+    
+    def test_tests_cut_off_by_a_crash_are_errors(self):
+        """Test tests a crashed worker never finished are reported as errors"""
+        entries = self.phases('a', 'setup', 'call', 'teardown') + self.phases('b', 'setup')
+        results = {r['nodeid']: r for r in self.runner._shard_results(0, ['a', 'b', 'c'], -9, entries, self.log_path)}
+        self.assertEqual(results['a']['outcome'], 'passed')
+        self.assertEqual(results['b']['outcome'], 'error')
+        self.assertEqual(results['c']['outcome'], 'error')
+        self.assertIn('Segmentation fault', results['c']['message'])
+    
+    def test_nonzero_exit_without_failures_is_an_error(self):
+        """Test a worker exiting non-zero with all tests passing still fails the run"""
+        entries = self.phases('a', 'setup', 'call', 'teardown')
+        results = self.runner._shard_results(0, ['a'], 3, entries, self.log_path)
+        self.assertEqual([r['outcome'] for r in results], ['passed', 'error'])
+    
+    def test_invented_results_do_not_touch_timings(self):
+        """Test synthetic errors stay out of the history and crashes keep prior durations"""
+        history = self.runner.history
+        history.update([{'nodeid': 'b', 'outcome': 'passed', 'duration': 2.0}])
+        entries = self.phases('a', 'setup', 'call', 'teardown')
+        history.update(self.runner._shard_results(0, ['a', 'b'], -9, entries, self.log_path))
+        history.update(self.runner._shard_results(1, ['a'], 3, entries, self.log_path))
+        self.assertEqual(history.duration('b'), 2.0)
+        self.assertEqual(history.failed_tests(), {'b'})
+        self.assertFalse(any(nodeid.startswith('parallel_test_runner::') for nodeid in history.tests))
+        
+        history.update([{'nodeid': 'c', 'outcome': 'error', 'duration': None, 'message': ''}])
+        self.assertIsNone(history.duration('c'))
+        history.update([{'nodeid': 'c', 'outcome': 'passed', 'duration': 1.5}])
+        self.assertEqual(history.duration('c'), 1.5)
+    
+    def test_failed_modules_are_selected_for_rerun(self):
+        """Test --failed reruns every test of a module that previously failed to collect"""
+        self.runner.history.update([{'nodeid': 'tests/t.py', 'outcome': 'error', 'duration': 0.0}])
+        test_ids = ['tests/t.py::test_one', 'tests/other.py::test_two']
+        self.assertEqual(self.runner.select_tests(test_ids, failed_only=True), test_ids[:1])
+
+if __name__ == '__main__':
+    unittest.main()